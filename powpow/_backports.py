@@ -6,6 +6,9 @@ Classes:
 
     _NOT_FOUND, cached_property
 
+Summary of changes: cached_property does not use a per-descriptor lock when
+filling the cache, the same as in Python 3.12.
+
 Are redistributed / licensed under the following terms:
 
     Copyright (c) 2001, 2002, 2003, 2004, 2005, 2006, 2007, 2008, 2009, 2010,
@@ -60,8 +63,6 @@ Are redistributed / licensed under the following terms:
     bound by the terms and conditions of this License Agreement.
 ----------------------------
 """
-from threading import RLock
-
 _NOT_FOUND = object()
 
 
@@ -70,7 +71,6 @@ class cached_property:
         self.func = func
         self.attrname = None
         self.__doc__ = func.__doc__
-        self.lock = RLock()
 
     def __set_name__(self, owner, name):
         if self.attrname is None:
@@ -99,19 +99,18 @@ class cached_property:
             raise TypeError(msg) from None
         val = cache.get(self.attrname, _NOT_FOUND)
         if val is _NOT_FOUND:
-            with self.lock:
-                # check if another thread filled cache while we awaited lock
-                val = cache.get(self.attrname, _NOT_FOUND)
-                if val is _NOT_FOUND:
-                    val = self.func(instance)
-                    try:
-                        cache[self.attrname] = val
-                    except TypeError:
-                        msg = (
-                            f"The '__dict__' attribute on "
-                            f"{type(instance).__name__!r} instance does not "
-                            f"support item assignment for caching "
-                            f"{self.attrname!r} property."
-                        )
-                        raise TypeError(msg) from None
+            # No lock here (same as in CPython 3.12+): a lock shared by the
+            # descriptor serializes first accesses across all instances. The
+            # worst case without it is computing the value twice, when two
+            # threads access it on the same instance at the same time.
+            val = self.func(instance)
+            try:
+                cache[self.attrname] = val
+            except TypeError:
+                msg = (
+                    f"The '__dict__' attribute on {type(instance).__name__!r} "
+                    f"instance does not support item assignment for caching "
+                    f"{self.attrname!r} property."
+                )
+                raise TypeError(msg) from None
         return val
@@ -2,12 +2,17 @@
 import io
 import re
 import os
+from array import array
+from bisect import bisect_right
 from collections import defaultdict
 from pathlib import Path
 from pprint import pformat
-from typing import Dict, List, Any, Union, Tuple
+from typing import (
+    Dict, List, Any, Union, Tuple, Pattern, Optional, Sequence
+)
 
 from functools import lru_cache
+from itertools import accumulate
 try:
     from functools import cached_property
 except ImportError:
@@ -16,6 +21,9 @@ except ImportError:
 ANSI_RED = '\u001b[31m'
 ANSI_RESET = '\u001b[0m'
 
+# Attributes that GrepResult and CatResult delegate to their str()
+_STR_DIR = frozenset(dir(str))
+
 
 try:
     match_cls = re.Match
@@ -26,16 +34,23 @@ except AttributeError:  # re.Match class is not available in Python 3.6
 LineMatches = List[match_cls]
 
 
+@lru_cache(maxsize=32)
+def _literal_regex(pattern: str) -> Pattern[str]:
+    """Compile a regex that matches ``pattern`` as a fixed string."""
+    return re.compile(re.escape(pattern))
+
+
 class grep:
     """Finds matches of a simple string in the object string representation.
 
-    Unless a plain string is used or a ``GrepResult`` object, the
-    representation of the object is obtained by using ``pprint.pformat()``.
+    Unless a plain string, a ``GrepResult``, or a ``CatResult`` object is
+    used, the representation of the object is obtained by using
+    ``pprint.pformat()``.
 
     Strings are matched by their contents (not their ``repr()``s).
 
-    ``GrepResult`` object is returned on a match. When matching ``GrepResult``,
-    its ``str()`` representation is used.
+    ``GrepResult`` object is returned on a match. When matching ``GrepResult``
+    or ``CatResult``, its ``str()`` representation is used.
 
     Raises ``ValueError`` if ``pattern`` is an empty string.
     """
@@ -46,29 +61,47 @@ class grep:
         self.pattern = pattern
         self.highlight = highlight
 
+        # Shared by all the results of this grep, so it is built only once
+        self._highlighted_pattern = ANSI_RED + pattern + ANSI_RESET
+
     def __ror__(self, obj):
-        if isinstance(obj, GrepResult):
+        if isinstance(obj, (GrepResult, CatResult)):
+            # Both are immutable and keep their str() cached, so there is no
+            # need to pretty-print them again.
             text = str(obj)
         elif isinstance(obj, str):
             text = obj
+        elif isinstance(obj, (int, float, complex, type(None))):
+            # pformat() would end up with the same repr(), only slower
+            text = repr(obj)
         else:
             text = pformat(obj)
 
-        matches = self._match(self.pattern, text)
-
+        # Matches are not searched for here - GrepResult finds them lazily, so
+        # that e.g. a plain truthiness check can stop at the first one.
         return GrepResult(
-            self.pattern, text, matches,
-            highlight=self.highlight
+            self.pattern, text,
+            highlight=self.highlight,
+            highlighted_pattern=self._highlighted_pattern
         )
 
     @staticmethod
-    def _match(pattern, text: str) -> LineMatches:
-        """Match lines to a fixed string
+    def _match(pattern: str, text: str) -> 'array[int]':
+        """Find all non-overlapping occurrences of a fixed string
 
-        Returns a list of (line, [slice, ...]) tuples, where each slice points
-        to a substring of line that contains the pattern.
+        Returns an array of offsets at which the occurrences start. Each one
+        ends ``len(pattern)`` characters later.
         """
-        return list(re.finditer(re.escape(pattern), text))
+        # str.find is much cheaper than going through the regex engine and
+        # allocating an re.Match object for every occurrence. A flat array of
+        # ints takes 8 bytes per match, instead of a tuple and its int objects.
+        pattern_len = len(pattern)
+        starts = array('q')
+        start = text.find(pattern)
+        while start != -1:
+            starts.append(start)
+            start = text.find(pattern, start + pattern_len)
+        return starts
 
 
 # TODO: document properties (numpy style)
@@ -94,11 +127,22 @@ class GrepResult:
     their own ``__str__()``.
     """
 
-    def __init__(self, pattern: str, string: str, matches: LineMatches,
-                 *, highlight: bool = True):
+    def __init__(self, pattern: str, string: str,
+                 matches: Optional[LineMatches] = None,
+                 *, highlight: bool = True,
+                 highlighted_pattern: Optional[str] = None):
         self._input = string
         self._pattern = pattern
-        self._matches = matches
+
+        # Given matches take the place of the lazily computed ones
+        if matches is not None:
+            self.matches = matches
+            self._starts = array('q', [m.start() for m in matches])
+
+        # Matches are fixed strings, so each one is highlighted the same way
+        if highlighted_pattern is None:
+            highlighted_pattern = ANSI_RED + pattern + ANSI_RESET
+        self._highlighted_pattern = highlighted_pattern
 
         self._str = None
 
@@ -113,18 +157,33 @@ class GrepResult:
 
     def __repr__(self):
         if self.highlight:
-            return self._colorized().rstrip('\n')
+            return self._colorized
         else:
             return str(self)
 
     def __bool__(self):
-        return bool(self._matches)
+        if '_starts' in self.__dict__:
+            return bool(self._starts)
+        # Stops at the first match, without finding all of them
+        return self._pattern in self._input
 
     def __getattr__(self, name):
-        return getattr(str(self), name)
+        # Private names that str doesn't have (e.g. IPython's _repr_html_, or
+        # __setstate__ looked up by copy) are rejected without building
+        # str(self) - which would also recurse if __init__ hasn't run.
+        if name.startswith('_') and name not in _STR_DIR:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        attr = getattr(str(self), name)
+        # The string never changes, so store the attribute on the instance -
+        # later lookups will find it there without going through here again.
+        if not name.startswith('_'):
+            self.__dict__[name] = attr
+        return attr
 
     def __dir__(self):
-        return list(set(dir(self._input) + super().__dir__()))
+        return list(_STR_DIR.union(super().__dir__()))
 
     def __eq__(self, other):
         return str(self) == str(other)
@@ -143,76 +202,96 @@ class GrepResult:
     def input(self) -> str:
         return self._input
 
-    @property
+    @cached_property
     def matches(self) -> LineMatches:
-        return self._matches
+        # Match objects are only built on demand - everything else works on
+        # the match offsets found by grep.
+        return list(_literal_regex(self._pattern).finditer(self._input))
 
     @cached_property
     def line_matches(self) -> Dict[int, LineMatches]:
-        newline_iterator = re.finditer('$', self.input, re.MULTILINE)
-
+        line_starts = self._line_starts
         line_matches = defaultdict(list)
 
-        line_idx = 0
-        start = 0
-        end = next(newline_iterator).start() + 1
-
         for match in self.matches:
-            while not (start <= match.start() < end):
-                line_idx += 1
-                start = end
-                end = next(newline_iterator).start() + 1
-
+            # A match starting at the newline character (i.e. when the pattern
+            # starts with one) belongs to the line that newline ends.
+            line_idx = bisect_right(line_starts, match.start()) - 1
             line_matches[line_idx].append(match)
 
         return dict(line_matches)
 
     @cached_property
-    def matched_lines(self) -> List[str]:
-        # each span stops right before the newline character
-        line_spans = tuple((m.start(), m.end() + 1)  # +1 for newline
-                           for m
-                           in re.finditer('^.*$', self.input, re.MULTILINE))
+    def _starts(self) -> Sequence[int]:
+        return grep._match(self._pattern, self._input)
 
-        lines_to_add = self.line_matches.keys()
-        lines = [''] * len(self.line_matches)
-
-        for matched_line_idx, line_to_add_idx in enumerate(lines_to_add):
-            matched_line = self.input[slice(*line_spans[line_to_add_idx])]
-            lines[matched_line_idx] = matched_line
+    @cached_property
+    def _line_starts(self) -> List[int]:
+        """Offsets at which the lines of the input start."""
+        text = self._input
+        line_starts = [0]
+        newline = text.find('\n')
+        while newline != -1:
+            line_starts.append(newline + 1)
+            newline = text.find('\n', newline + 1)
+        return line_starts
 
+    @cached_property
+    def matched_lines(self) -> List[str]:
+        # Line boundaries are only looked up around the matches, so that the
+        # whole input does not have to be split up when few lines match.
+        text = self._input
+        lines = []
+        line_end = -1
+        for match_start in self._starts:
+            if match_start <= line_end:
+                continue  # still on the last matched line
+            line_start = text.rfind('\n', 0, match_start) + 1
+            line_end = text.find('\n', match_start)
+            if line_end == -1:
+                line_end = len(text)
+            lines.append(text[line_start:line_end + 1])  # +1 for newline
         return lines
 
-    @lru_cache(maxsize=1)
-    def _colorized(self):
+    @cached_property
+    def _colorized(self) -> str:
+        # Highlighted matched lines, computed on the first repr() only
+        if not self._starts:
+            return ''
+
+        text = self._input
+        pattern_len = len(self._pattern)
         buf = io.StringIO()
-        line_spans = tuple((m.start(), m.end())
-                           for m
-                           in re.finditer('^.*$', self.input, re.MULTILINE))
-        for line, line_idx, matches in zip(self.matched_lines,
-                                           self.line_matches.keys(),
-                                           self.line_matches.values()):
-            start = line_spans[line_idx][0]
-            for match in matches:
-                end = match.start()
-                buf.write(self.input[start:end])
-
-                start = match.start()
-                end = match.end()
-                buf.write(ANSI_RED)
-                buf.write(self.input[start:end])
-                buf.write(ANSI_RESET)
-
-                start = match.end()
-            end = line_spans[line_idx][1]
-            buf.write(self.input[start:end + 1])  # +1 for newline
-        return buf.getvalue()
+        write = buf.write  # called several times per match
+        highlighted = self._highlighted_pattern
+
+        # Single pass over the matches: line boundaries are only looked up for
+        # lines that contain a match, instead of scanning the whole input.
+        written = 0  # everything before this index has been handled already
+        line_end = -1
+        for match_start in self._starts:
+            if match_start > line_end:
+                if line_end >= 0:
+                    write(text[written:line_end + 1])  # +1 for newline
+                line_start = text.rfind('\n', 0, match_start) + 1
+                written = max(written, line_start)
+                line_end = text.find('\n', match_start)
+                if line_end == -1:
+                    line_end = len(text)
+            write(text[written:match_start])
+            write(highlighted)
+            written = match_start + pattern_len
+        write(text[written:line_end + 1])  # +1 for newline
+        # repr() doesn't show the last newline
+        return buf.getvalue().rstrip('\n')
 
 
 def cat(*paths: Union[str, 'os.PathLike[Any]']) -> 'CatResult':
     """Reads text from files & CATenates it."""
     _paths = tuple(Path(path) for path in paths)
-    contents = tuple(p.read_text() for p in _paths)
+    # A file given more than once is read only once
+    text_per_path = {p: p.read_text() for p in dict.fromkeys(_paths)}
+    contents = tuple(text_per_path[p] for p in _paths)
     return CatResult(_paths, contents)
 
 
@@ -241,28 +320,36 @@ class CatResult:
         assert len(paths) == len(contents)
 
         self._paths = paths
-        self._contents = contents
 
-        self._str = None
+        # The files have already been read in full, so there is nothing to
+        # gain from catenating lazily. Only the catenation is kept - contents
+        # of each file are sliced out of it on first access, so that the text
+        # is not held in memory twice unless they are asked for.
+        self._str = ''.join(contents)
+        self._ends = tuple(accumulate(len(c) for c in contents))
 
     def __str__(self):
-        # This cannot be cached using lru_cache, otherwise it causes unbound
-        # recursion between lru_cache → __hash__ → __str__ → lru_cache
-        if self._str is None:
-            self._str = ''.join(self.contents)
         return self._str
 
     def __repr__(self):
-        return str(self)
+        return self._str
 
     def __getattr__(self, name):
-        return getattr(str(self), name)
+        # See GrepResult.__getattr__
+        if name.startswith('_') and name not in _STR_DIR:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        attr = getattr(self._str, name)
+        if not name.startswith('_'):
+            self.__dict__[name] = attr
+        return attr
 
     def __dir__(self):
-        return list(set(dir(self._input) + super().__dir__()))
+        return list(_STR_DIR.union(super().__dir__()))
 
     def __bool__(self):
-        return any(self._contents)
+        return bool(self._str)
 
     def __eq__(self, other):
         return str(self) == str(other)
@@ -274,15 +361,17 @@ class CatResult:
     def paths(self) -> Tuple[Path, ...]:
         return self._paths
 
-    @property
+    @cached_property
     def contents(self) -> Tuple[str, ...]:
-        return self._contents
+        starts = (0,) + self._ends[:-1]
+        return tuple(self._str[start:end]
+                     for start, end in zip(starts, self._ends))
 
     @property
     def per_file(self):
         # This is specifically done here to forbid mutation of the return value
         # Do not cache this.
-        return {p: c for p, c in zip(self._paths, self._contents)}
+        return {p: c for p, c in zip(self._paths, self.contents)}
 
     def json(self, **loads_kwargs) -> Any:
         """Interpret this catenation as json, parse it, and return the result.
@@ -1,3 +1,4 @@
+import copy
 import itertools
 import pytest
 
@@ -33,6 +34,10 @@ class TestCatInit:
         tmp_file.write_text(contents)
         assert str(cat(tmp_file)) == contents
 
+    def test_translates_newlines_like_text_mode(self, tmp_file):
+        tmp_file.write_bytes(b"windows\r\nold mac\runix\n")
+        assert str(cat(tmp_file)) == "windows\nold mac\nunix\n"
+
     def test_returns_CatResult(self, tmp_file):
         assert isinstance(cat(tmp_file), CatResult)
 
@@ -59,6 +64,23 @@ class TestCatResult:
         contents = ("contents", "contents", "contents")
         assert cat(*paths).contents == contents
 
+    def test_contents_keep_the_order_of_paths(self, tmp_path):
+        paths = [tmp_path / str(i) for i in range(20)]
+        for i, path in enumerate(paths):
+            path.write_text(str(i))
+        assert cat(*paths).contents == tuple(str(i) for i in range(20))
+
+    def test_repeated_paths_repeat_contents(self, tmp_path):
+        file_a, file_b = tmp_path / 'a', tmp_path / 'b'
+        file_a.write_text("a")
+        file_b.write_text("b")
+        assert str(cat(file_a, file_b, str(file_a), file_a)) == "abaa"
+
+    def test_contents_are_built_once(self, tmp_file):
+        tmp_file.write_text("contents")
+        result = cat(tmp_file, tmp_file)
+        assert result.contents is result.contents
+
     def test_cat_result_strs_to_catenated_contents(self, tmp_file):
         contents = "contents"
         tmp_file.write_text(contents)
@@ -74,3 +96,11 @@ class TestCatResult:
     def test_is_hashable(self, tmp_file):
         tmp_file.touch()
         hash(cat(tmp_file))
+
+    def test_dir_lists_str_methods(self, tmp_file):
+        assert 'splitlines' in dir(cat(tmp_file))
+
+    def test_can_be_copied(self, tmp_file):
+        tmp_file.write_text("contents")
+        result = cat(tmp_file)
+        assert copy.copy(result) == result
@@ -1,3 +1,5 @@
+import copy
+import re
 import pytest
 
 from textwrap import dedent
@@ -11,6 +13,10 @@ class TestGrep:
         output = ("this is a string" | grep("string"))
         assert bool(output) is True
 
+    def test_no_match_is_falsy(self):
+        output = ("this is a string" | grep("text"))
+        assert bool(output) is False
+
     def test_grep_multiple_times(self):
         output = ("this is a string" | grep("string") | grep("string"))
         assert bool(output) is True
@@ -69,3 +75,55 @@ class TestGrep:
         text = "This input has a newline that should be preserved \n"
         # But repr(result) does not
         assert not repr(text | grep("This")).endswith('\n')
+
+    def test_matches_are_re_match_objects(self):
+        result = "a string with a pattern" | grep("a")
+        spans = [m.span() for m in result.matches]
+        assert spans == [(0, 1), (14, 15), (17, 18)]
+
+    def test_line_matches_maps_lines_to_matches(self):
+        result = "xax\nbbb\nxaxa\n" | grep("a")
+        starts = {idx: [m.start() for m in matches]
+                  for idx, matches in result.line_matches.items()}
+        assert starts == {0: [1], 2: [9, 11]}
+
+    def test_str_methods_are_available(self):
+        result = "this is a string\nand this is not" | grep("string")
+        assert result.upper() == "THIS IS A STRING\n"
+        assert result.split() == ["this", "is", "a", "string"]
+
+    def test_str_methods_are_cached_on_the_instance(self):
+        result = "this is a string\nand this is not" | grep("string")
+        result.upper
+        assert 'upper' in vars(result)
+        assert result.__len__() == len("this is a string\n")
+        assert '__len__' not in vars(result)
+
+    def test_dir_lists_str_methods(self):
+        assert 'splitlines' in dir("a" | grep("a"))
+
+    def test_grep_a_number(self):
+        assert 12345 | grep("234") == "12345"
+
+    def test_can_be_copied(self):
+        result = "this is a string" | grep("string")
+        assert copy.copy(result) == result
+
+    def test_equal_results_from_different_inputs_hash_the_same(self):
+        r1 = "x\nfoo\n" | grep("foo")
+        r2 = "y\nfoo\n" | grep("foo")
+        assert r1 == r2 and hash(r1) == hash(r2)
+
+    def test_result_finds_matches_itself(self):
+        assert GrepResult("a", "abc") == "abc"
+
+    def test_result_uses_given_matches(self):
+        matches = list(re.finditer("b", "abc\nb"))[1:]
+        result = GrepResult("b", "abc\nb", matches)
+        assert result.matches is matches
+        assert result.line_matches == {1: matches}
+        assert str(result) == "b"
+
+    def test_result_with_no_given_matches_is_falsy(self):
+        result = GrepResult("a", "abc", [])
+        assert not result and str(result) == ""